@@ -0,0 +1,296 @@
+import streamlit as st
+import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import time
+import hashlib
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Tuple
+from typing import Dict, Any
+from urllib.parse import quote
+from PIL import Image
+from io    import BytesIO
+
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────────────
+API_BASE_URL = "https://cataas.com"
+RATE_LIMIT_SECONDS = 2
+MAX_RETRIES = 3
+DEFAULT_IMAGE_SIZE = (400, 400)
+THUMBNAIL_SIZE = (256, 256)
+
+# Endpoints built once at import instead of on every call
+_TAGS_URL = API_BASE_URL + "/api/tags"
+_RANDOM_CAT_URL = API_BASE_URL + "/cat?json=true"
+_TAGGED_CAT_URL_TEMPLATE = API_BASE_URL + "/cat/{tag}?json=true"
+_URL_PREFIX = API_BASE_URL + "/"
+# cataas tags are words, possibly with spaces or dashes (e.g. "orange cat")
+_TAG_RE = re.compile(r"[\w\- ]+")
+
+logger = logging.getLogger(__name__)
+
+
+_LOGGED_ONCE: Set[Tuple[str, str]] = set()
+
+
+def _log_once(key: Tuple[str, str], msg: str, *args):
+    """Warn only the first time `key` is seen, e.g. the same failure on every rerun.
+
+    Keys must be stable (not exception text, which embeds object addresses);
+    `msg` is %-formatted lazily by logging.
+    """
+    if key in _LOGGED_ONCE:
+        return
+    _LOGGED_ONCE.add(key)
+    logger.warning(msg, *args)
+
+# ─── HTTP SESSION ───────────────────────────────────────────────────────────────
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Pooled keep-alive session for cataas.com, shared across script reruns."""
+    session = requests.Session()
+    session.mount(API_BASE_URL, HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(total=MAX_RETRIES, backoff_factor=1, status_forcelist=[502, 503, 504]),
+    ))
+    session.headers["User-Agent"] = "Streamlit-Cat-App"
+    return session
+
+@st.cache_resource
+def _pool() -> ThreadPoolExecutor:
+    """Background workers for speculative prefetches."""
+    return ThreadPoolExecutor(max_workers=2)
+
+# ─── SESSION-STATE SETUP ────────────────────────────────────────────────────────
+def init_session_state():
+    """Seed per-user state; called once per run by the launcher before any page."""
+    if 'last_api_call'   not in st.session_state: st.session_state.last_api_call = 0
+    if 'favorites'       not in st.session_state: st.session_state.favorites   = {"keys": [], "urls": [], "tags": [], "added": [], "thumbs": []}
+    if 'api_call_count'  not in st.session_state: st.session_state.api_call_count = 0
+    if 'gen'             not in st.session_state: st.session_state.gen = 0
+
+def rate_limit_check() -> bool:
+    now = time.time()
+    if now - st.session_state.last_api_call < RATE_LIMIT_SECONDS:
+        return False
+    st.session_state.last_api_call = now
+    st.session_state.api_call_count += 1
+    return True
+
+@st.cache_data(ttl=3600)
+def fetch_tags() -> List[str]:
+    if not rate_limit_check():
+        return []
+    try:
+        resp = get_session().get(_TAGS_URL, timeout=5)
+        resp.raise_for_status()
+        tags = orjson.loads(resp.content)
+        if not isinstance(tags, list):
+            raise ValueError("Malformed tags list")
+        # only offer tags that get_cat_url will accept
+        tags = [t for t in tags if isinstance(t, str) and _TAG_RE.fullmatch(t)]
+        # in place; Timsort is O(n) when cataas already returns them sorted
+        tags.sort()
+        return tags
+    except Exception as e:
+        logger.warning("fetch_tags failed: %s", e)
+    st.error("Could not load cat tags. Try again later.")
+    return []
+
+def validate_url(url: str) -> bool:
+    # Every favorite comes from get_cat_url, so a prefix check is all we need.
+    return isinstance(url, str) and 0 < len(url) < 2048 and url.startswith(_URL_PREFIX)
+
+
+def _request_cat_url(session: requests.Session, tag: str) -> str:
+    """Resolve a random cat (optionally by tag) to an image URL via the JSON API.
+
+    Pure network call with no Streamlit state, so it is safe to run off-thread.
+    """
+    url = _TAGGED_CAT_URL_TEMPLATE.format(tag=quote(tag)) if tag else _RANDOM_CAT_URL
+    resp = session.get(url, timeout=5)
+    resp.raise_for_status()
+    raw = orjson.loads(resp.content).get("url", "")
+
+    # only prefix if it's a relative path
+    if raw.startswith("http"):
+        return raw
+    return f"{API_BASE_URL}{raw}"
+
+
+def get_cat_url(tag: str) -> Optional[str]:
+    """Fetch a random cat (optionally by tag) via the JSON API.
+
+    A ready prefetch is used instead of a new request, but only once the rate
+    limit allows a call; while throttled it is kept for the next attempt.
+    """
+    if not rate_limit_check():
+        st.warning("Rate limit: slow down a bit 😉")
+        return None
+
+    if tag and not _TAG_RE.fullmatch(tag):
+        st.error("Invalid tag")
+        return None
+
+    prefetched = take_prefetched_url(tag)
+    if prefetched:
+        return prefetched
+
+    try:
+        return _request_cat_url(get_session(), tag)
+    except Exception as e:
+        logger.warning("get_cat_url failed: %s", e)
+        st.error("Failed to get cat image. Try again later.")
+        return None
+
+
+def prefetch_cat_url(tag: str):
+    """Start resolving the next cat for `tag` in the background."""
+    if tag and not _TAG_RE.fullmatch(tag):
+        return
+    pending = st.session_state.pop("next_url", None)
+    if pending is not None:
+        pending[1].cancel()
+    future = _pool().submit(_request_cat_url, get_session(), tag)
+    # counted by rate_limit_check when get_cat_url hands it out
+    st.session_state.next_url = (tag, future)
+
+
+def take_prefetched_url(tag: str) -> Optional[str]:
+    """Return the prefetched URL if it is ready and matches `tag`, else None."""
+    pending = st.session_state.pop("next_url", None)
+    if pending is None:
+        return None
+    pending_tag, future = pending
+    if pending_tag != tag or not future.done():
+        # free the shared pool instead of leaving an abandoned job queued
+        future.cancel()
+        return None
+    exc = future.exception()
+    if exc is not None:
+        # during an outage every render discards a failed prefetch; log it once
+        _log_once(("prefetch", type(exc).__name__), "prefetch failed: %s", exc)
+        return None
+    return future.result()
+
+
+def current_cat_url(tag: str) -> Optional[str]:
+    """Return the cat for this Generate click, resolving it only once.
+
+    Reruns from other widgets (sliders, favorite button) reuse the stored URL
+    instead of hitting the API again.
+    """
+    current = st.session_state.get("current_cat")
+    if current is not None and current[:2] == (st.session_state.gen, tag):
+        return current[2]
+    url = get_cat_url(tag)
+    if url:
+        st.session_state.current_cat = (st.session_state.gen, tag, url)
+        prefetch_cat_url(tag)
+    return url
+
+
+
+
+def make_thumbnail(url: str) -> Optional[bytes]:
+    """Download `url` once and return a small WEBP thumbnail, or None on failure."""
+    try:
+        resp = get_session().get(url, timeout=5)
+        resp.raise_for_status()
+        img = Image.open(BytesIO(resp.content))
+        img.thumbnail(THUMBNAIL_SIZE)
+        buf = BytesIO()
+        img.save(buf, format="WEBP", quality=80)
+        return buf.getvalue()
+    except Exception as e:
+        logger.warning("make_thumbnail failed: %s", e)
+        return None
+
+
+def save_favorite(url: str, tag: str):
+    if not validate_url(url):
+        st.error("Invalid URL")
+        return
+
+    favs = st.session_state.favorites
+    key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    if key in favs["keys"]:
+        st.info("This cat is already in your favorites.")
+        return
+
+    # Limit total favorites
+    if len(favs["keys"]) >= 25:
+        st.warning("Maximum favorites limit reached. Remove some old favorites first.")
+        return
+
+    # parallel column lists, one entry per favorite
+    favs["keys"].append(key)
+    favs["urls"].append(url)
+    favs["tags"].append(tag)
+    favs["added"].append(int(time.time()))
+    favs["thumbs"].append(make_thumbnail(url))
+    st.success("❤️ Added to favorites!")
+
+
+def show_favorites():
+    favs = st.session_state.favorites
+    if not favs["keys"]:
+        st.info("No favorites yet!")
+        return
+    st.subheader("Your Favorites")
+    # one st.columns row per 3 favorites keeps each row's widget tree small
+    for start in range(0, len(favs["keys"]), 3):
+        row = st.columns(3)
+        for col, i in zip(row, range(start, min(start + 3, len(favs["keys"])))):
+            with col:
+                # fall back to the full image if the thumbnail could not be built
+                st.image(favs["thumbs"][i] or favs["urls"][i], caption=favs["tags"][i])
+                if st.button("Remove", key=f"rm_{favs['keys'][i]}"):
+                    for column in favs.values():
+                        column.pop(i)
+                    st.rerun()
+
+def show_generator():
+    st.title("🐱 Cat Image Generator")
+    st.write("Generate and save your favorite cat pics from cataas.com!")
+
+    # ── Sidebar UI ────────────────────────────────────────────────────────────────
+    with st.sidebar:
+        st.header("Settings")
+        w = st.slider("Width",  100, 800, DEFAULT_IMAGE_SIZE[0], 50)
+        h = st.slider("Height", 100, 800, DEFAULT_IMAGE_SIZE[1], 50)
+        show_fav = st.checkbox("Show Favorites")
+        st.markdown("---")
+        st.header("API Usage")
+        st.write(f"Calls today: {st.session_state.api_call_count}")
+
+    # ── Fetch tags & build controls ──────────────────────────────────────────────
+    tags = fetch_tags()
+    choice = None
+    if tags:
+        c1,c2 = st.columns([3,1])
+        with c1:
+            choice = st.selectbox("Pick a tag (or leave blank):", [""] + tags)
+        with c2:
+            if st.button("🎲 Generate"):
+                st.session_state.gen += 1
+
+    # ── Show image & favorite button ─────────────────────────────────────────────
+    if st.session_state.gen > 0:
+        url = current_cat_url(choice)
+        if url:
+            st.image(url,
+                     caption=f"{choice or 'Random'} cat",
+                     use_container_width=True)
+
+            if st.button("❤️ Favorite this"):
+                save_favorite(url, choice)
+
+    # ── Favorites section ─────────────────────────────────────────────────────────
+    if show_fav:
+        st.markdown("---")
+        show_favorites()
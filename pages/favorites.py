@@ -0,0 +1,3 @@
+from cat_core import show_favorites
+
+show_favorites()